@@ -5,6 +5,7 @@ pub mod determinize;
 pub mod isomorphic;
 pub mod optimize;
 pub mod project;
+pub mod quantize;
 pub mod randgen;
 pub mod replace;
 pub mod reverse;
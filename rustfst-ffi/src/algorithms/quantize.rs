@@ -0,0 +1,22 @@
+use anyhow::anyhow;
+
+use crate::fst::CFst;
+use crate::{get_mut, wrap, RUSTFST_FFI_RESULT};
+
+use rustfst::algorithms::tr_map;
+use rustfst::algorithms::tr_mappers::QuantizeMapper;
+use rustfst::fst_impls::VectorFst;
+use rustfst::semirings::TropicalWeight;
+
+#[no_mangle]
+pub extern "C" fn fst_quantize(ptr: *mut CFst, delta: libc::c_float) -> RUSTFST_FFI_RESULT {
+    wrap(|| {
+        let fst = get_mut!(CFst, ptr);
+        let vec_fst: &mut VectorFst<TropicalWeight> = fst
+            .downcast_mut()
+            .ok_or_else(|| anyhow!("Could not downcast to vector FST"))?;
+
+        tr_map(vec_fst, &QuantizeMapper::new(delta))?;
+        Ok(())
+    })
+}
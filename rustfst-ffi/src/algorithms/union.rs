@@ -1,10 +1,12 @@
-use anyhow::anyhow;
+use anyhow::{anyhow, Result};
 
 use crate::fst::CFst;
 use crate::{get, get_mut, wrap, RUSTFST_FFI_RESULT};
 
+use ffi_convert::*;
 use rustfst::algorithms::union::union;
 use rustfst::fst_impls::VectorFst;
+use rustfst::fst_traits::{AllocableFst, ExpandedFst};
 use rustfst::semirings::TropicalWeight;
 
 #[no_mangle]
@@ -22,3 +24,35 @@ pub extern "C" fn fst_union(fst_1: *mut CFst, fst_2: *const CFst) -> RUSTFST_FFI
         Ok(())
     })
 }
+
+#[no_mangle]
+pub extern "C" fn fst_union_list(
+    fsts: *const *const CFst,
+    num_fsts: libc::size_t,
+    union_fst: *mut *const CFst,
+) -> RUSTFST_FFI_RESULT {
+    wrap(|| {
+        if num_fsts == 0 {
+            return Err(anyhow!("At least one fst is needed to compute the union"));
+        }
+        let fsts = unsafe { std::slice::from_raw_parts(fsts, num_fsts) };
+        let vec_fsts = fsts
+            .iter()
+            .map(|&fst_ptr| -> Result<&VectorFst<TropicalWeight>> {
+                let fst = get!(CFst, fst_ptr);
+                fst.downcast_ref()
+                    .ok_or_else(|| anyhow!("Could not downcast to vector FST"))
+            })
+            .collect::<Result<Vec<_>>>()?;
+
+        // All the states are copied into the first fst: allocate them once upfront.
+        let mut res = vec_fsts[0].clone();
+        res.reserve_states(vec_fsts[1..].iter().map(|f| f.num_states() + 1).sum());
+        for vec_fst in &vec_fsts[1..] {
+            union(&mut res, *vec_fst)?;
+        }
+
+        unsafe { *union_fst = CFst(Box::new(res)).into_raw_pointer() };
+        Ok(())
+    })
+}
@@ -0,0 +1,47 @@
+use rustfst::DrawingConfig;
+
+/// C representation of the options used to draw an FST.
+/// `width`, `height`, `ranksep` and `nodesep` are ignored when negative.
+#[repr(C)]
+#[derive(Debug, Clone)]
+pub struct CDrawingConfig {
+    pub width: libc::c_float,
+    pub height: libc::c_float,
+    pub ranksep: libc::c_float,
+    pub nodesep: libc::c_float,
+    pub acceptor: libc::size_t,
+    pub portrait: libc::size_t,
+    pub vertical: libc::size_t,
+    pub fontsize: libc::size_t,
+    pub show_weight_one: libc::size_t,
+    pub print_weight: libc::size_t,
+}
+
+impl CDrawingConfig {
+    pub(crate) fn to_drawing_config(&self, title: String) -> DrawingConfig {
+        DrawingConfig {
+            vertical: self.vertical > 0,
+            size: if self.width >= 0.0 && self.height >= 0.0 {
+                Some((self.width, self.height))
+            } else {
+                None
+            },
+            title,
+            portrait: self.portrait > 0,
+            ranksep: if self.ranksep >= 0.0 {
+                Some(self.ranksep)
+            } else {
+                None
+            },
+            nodesep: if self.nodesep >= 0.0 {
+                Some(self.nodesep)
+            } else {
+                None
+            },
+            fontsize: self.fontsize as u32,
+            acceptor: self.acceptor > 0,
+            show_weight_one: self.show_weight_one > 0,
+            print_weight: self.print_weight > 0,
+        }
+    }
+}
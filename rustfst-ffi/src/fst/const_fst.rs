@@ -1,6 +1,6 @@
 use super::*;
+use crate::drawing_config::CDrawingConfig;
 use anyhow::anyhow;
-use rustfst::DrawingConfig;
 use std::ffi::CString;
 
 #[no_mangle]
@@ -74,6 +74,30 @@ pub fn const_fst_draw(
     fontsize: libc::size_t,
     show_weight_one: libc::size_t,
     print_weight: libc::size_t,
+) -> RUSTFST_FFI_RESULT {
+    let config = CDrawingConfig {
+        width,
+        height,
+        ranksep,
+        nodesep,
+        acceptor,
+        portrait,
+        vertical,
+        fontsize,
+        show_weight_one,
+        print_weight,
+    };
+    const_fst_draw_with_config(fst_ptr, isyms, osyms, fname, title, &config)
+}
+
+#[no_mangle]
+pub extern "C" fn const_fst_draw_with_config(
+    fst_ptr: *mut CFst,
+    isyms: *const CSymbolTable,
+    osyms: *const CSymbolTable,
+    fname: *const libc::c_char,
+    title: *const libc::c_char,
+    config: *const CDrawingConfig,
 ) -> RUSTFST_FFI_RESULT {
     wrap(|| {
         let fst = get_mut!(CFst, fst_ptr);
@@ -89,22 +113,9 @@ pub fn const_fst_draw(
             const_fst.fst_set_output_symbols(osymt.clone());
         }
 
-        let drawing_config = DrawingConfig {
-            vertical: vertical > 0,
-            size: if width >= 0.0 && height >= 0.0 {
-                Some((width, height))
-            } else {
-                None
-            },
-            title: unsafe { CStr::from_ptr(title).as_rust()? },
-            portrait: portrait > 0,
-            ranksep: if ranksep >= 0.0 { Some(ranksep) } else { None },
-            nodesep: if nodesep >= 0.0 { Some(nodesep) } else { None },
-            fontsize: fontsize as u32,
-            acceptor: acceptor > 0,
-            show_weight_one: show_weight_one > 0,
-            print_weight: print_weight > 0,
-        };
+        let config =
+            unsafe { config.as_ref() }.ok_or_else(|| anyhow!("Drawing config ptr is null"))?;
+        let drawing_config = config.to_drawing_config(unsafe { CStr::from_ptr(title).as_rust()? });
 
         const_fst.draw(unsafe { CStr::from_ptr(fname).as_rust()? }, &drawing_config)?;
 
@@ -0,0 +1,86 @@
+use anyhow::{Context, Result};
+use rustfst::fst_traits::SerializableFst;
+use rustfst::semirings::SerializableSemiring;
+use std::path::Path;
+
+/// Loads an FST in binary format from a file mapped in memory.
+///
+/// Compared to `SerializableFst::read`, the file content is never copied to an
+/// intermediate heap buffer: pages are faulted in by the kernel while the FST is parsed.
+#[cfg(unix)]
+pub(crate) fn read_mmap<W, F, P>(path: P) -> Result<F>
+where
+    W: SerializableSemiring,
+    F: SerializableFst<W>,
+    P: AsRef<Path>,
+{
+    let path = path.as_ref();
+    let mmap = Mmap::open(path)
+        .with_context(|| format!("Can't mmap {}Fst binary file : {:?}", F::fst_type(), path))?;
+    F::load(mmap.as_slice())
+}
+
+#[cfg(not(unix))]
+pub(crate) fn read_mmap<W, F, P>(path: P) -> Result<F>
+where
+    W: SerializableSemiring,
+    F: SerializableFst<W>,
+    P: AsRef<Path>,
+{
+    F::read(path)
+}
+
+/// Read-only memory mapping of a whole file.
+#[cfg(unix)]
+struct Mmap {
+    ptr: *mut libc::c_void,
+    len: usize,
+}
+
+#[cfg(unix)]
+impl Mmap {
+    fn open(path: &Path) -> Result<Self> {
+        use std::os::unix::io::AsRawFd;
+
+        let file = std::fs::File::open(path)?;
+        let len = file.metadata()?.len() as usize;
+        if len == 0 {
+            return Ok(Self {
+                ptr: std::ptr::null_mut(),
+                len,
+            });
+        }
+        let ptr = unsafe {
+            libc::mmap(
+                std::ptr::null_mut(),
+                len,
+                libc::PROT_READ,
+                libc::MAP_PRIVATE,
+                file.as_raw_fd(),
+                0,
+            )
+        };
+        if ptr == libc::MAP_FAILED {
+            return Err(std::io::Error::last_os_error().into());
+        }
+        // The FST is parsed from start to end, let the kernel read ahead aggressively.
+        unsafe { libc::madvise(ptr, len, libc::MADV_SEQUENTIAL) };
+        Ok(Self { ptr, len })
+    }
+
+    fn as_slice(&self) -> &[u8] {
+        if self.len == 0 {
+            return &[];
+        }
+        unsafe { std::slice::from_raw_parts(self.ptr as *const u8, self.len) }
+    }
+}
+
+#[cfg(unix)]
+impl Drop for Mmap {
+    fn drop(&mut self) {
+        if self.len > 0 {
+            unsafe { libc::munmap(self.ptr, self.len) };
+        }
+    }
+}
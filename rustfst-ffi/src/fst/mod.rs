@@ -1,5 +1,6 @@
 pub mod concat_fst;
 pub mod const_fst;
+mod mmap;
 pub mod utils;
 pub mod vector_fst;
 
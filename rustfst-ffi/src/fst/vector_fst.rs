@@ -1,13 +1,16 @@
 use super::*;
+use crate::drawing_config::CDrawingConfig;
+use crate::fst::mmap::read_mmap;
 use crate::get_symt;
 use anyhow::{anyhow, format_err};
 use ffi_convert::CArray;
-use rustfst::fst_traits::ExpandedFst;
-use rustfst::DrawingConfig;
+use rustfst::fst_traits::{AllocableFst, ExpandedFst};
+use rustfst::{Label, Tr};
+use std::convert::TryFrom;
 use std::ffi::CString;
 
 #[no_mangle]
-pub fn vec_fst_new(ptr: *mut *const CFst) -> RUSTFST_FFI_RESULT {
+pub extern "C" fn vec_fst_new(ptr: *mut *const CFst) -> RUSTFST_FFI_RESULT {
     wrap(|| {
         let fst = Box::new(VectorFst::new());
         let raw_pointer = CFst(fst).into_raw_pointer();
@@ -17,7 +20,7 @@ pub fn vec_fst_new(ptr: *mut *const CFst) -> RUSTFST_FFI_RESULT {
 }
 
 #[no_mangle]
-pub fn vec_fst_set_start(fst: *mut CFst, state: CStateId) -> RUSTFST_FFI_RESULT {
+pub extern "C" fn vec_fst_set_start(fst: *mut CFst, state: CStateId) -> RUSTFST_FFI_RESULT {
     wrap(|| {
         let c_fst = get_mut!(CFst, fst);
         let vec_fst = as_mut_fst!(VectorFst<TropicalWeight>, c_fst);
@@ -27,7 +30,7 @@ pub fn vec_fst_set_start(fst: *mut CFst, state: CStateId) -> RUSTFST_FFI_RESULT
 }
 
 #[no_mangle]
-pub fn vec_fst_set_final(
+pub extern "C" fn vec_fst_set_final(
     fst: *mut CFst,
     state: CStateId,
     weight: libc::c_float,
@@ -41,7 +44,7 @@ pub fn vec_fst_set_final(
 }
 
 #[no_mangle]
-pub fn vec_fst_add_state(fst: *mut CFst, state: *mut CStateId) -> RUSTFST_FFI_RESULT {
+pub extern "C" fn vec_fst_add_state(fst: *mut CFst, state: *mut CStateId) -> RUSTFST_FFI_RESULT {
     wrap(|| {
         let fst = get_mut!(CFst, fst);
         let vec_fst = as_mut_fst!(VectorFst<TropicalWeight>, fst);
@@ -52,7 +55,28 @@ pub fn vec_fst_add_state(fst: *mut CFst, state: *mut CStateId) -> RUSTFST_FFI_RE
 }
 
 #[no_mangle]
-pub fn vec_fst_delete_states(fst: *mut CFst) -> RUSTFST_FFI_RESULT {
+pub extern "C" fn vec_fst_add_states(
+    fst: *mut CFst,
+    num_states: libc::size_t,
+    first_state: *mut CStateId,
+) -> RUSTFST_FFI_RESULT {
+    wrap(|| {
+        let fst = get_mut!(CFst, fst);
+        let vec_fst = as_mut_fst!(VectorFst<TropicalWeight>, fst);
+        let first = vec_fst.num_states();
+        // The ids of the new states must be representable as `StateId`s.
+        first
+            .checked_add(num_states)
+            .filter(|&n| StateId::try_from(n).is_ok())
+            .ok_or_else(|| format_err!("Can't add {} more states", num_states))?;
+        vec_fst.add_states(num_states);
+        unsafe { *first_state = first as CStateId }
+        Ok(())
+    })
+}
+
+#[no_mangle]
+pub extern "C" fn vec_fst_delete_states(fst: *mut CFst) -> RUSTFST_FFI_RESULT {
     wrap(|| {
         let fst = get_mut!(CFst, fst);
         let vec_fst = as_mut_fst!(VectorFst<TropicalWeight>, fst);
@@ -62,7 +86,11 @@ pub fn vec_fst_delete_states(fst: *mut CFst) -> RUSTFST_FFI_RESULT {
 }
 
 #[no_mangle]
-pub fn vec_fst_add_tr(fst: *mut CFst, state: CStateId, tr: *const CTr) -> RUSTFST_FFI_RESULT {
+pub extern "C" fn vec_fst_add_tr(
+    fst: *mut CFst,
+    state: CStateId,
+    tr: *const CTr,
+) -> RUSTFST_FFI_RESULT {
     wrap(|| {
         let fst = get_mut!(CFst, fst);
         let tr = unsafe { <CTr as ffi_convert::RawBorrow<CTr>>::raw_borrow(tr)? }.as_rust()?;
@@ -73,7 +101,92 @@ pub fn vec_fst_add_tr(fst: *mut CFst, state: CStateId, tr: *const CTr) -> RUSTFS
 }
 
 #[no_mangle]
-pub fn vec_fst_del_final_weight(fst: *mut CFst, state: CStateId) -> RUSTFST_FFI_RESULT {
+pub extern "C" fn vec_fst_add_trs(
+    fst: *mut CFst,
+    state: CStateId,
+    trs: *const *const CTr,
+    num_trs: libc::size_t,
+) -> RUSTFST_FFI_RESULT {
+    wrap(|| {
+        let fst = get_mut!(CFst, fst);
+        let vec_fst = as_mut_fst!(VectorFst<TropicalWeight>, fst);
+        if num_trs == 0 {
+            return Ok(());
+        }
+        let trs = unsafe { std::slice::from_raw_parts(trs, num_trs) };
+        vec_fst.reserve_trs(state, num_trs)?;
+        for tr in trs {
+            let tr = unsafe { <CTr as ffi_convert::RawBorrow<CTr>>::raw_borrow(*tr)? }.as_rust()?;
+            vec_fst.add_tr(state, tr)?;
+        }
+        Ok(())
+    })
+}
+
+#[no_mangle]
+pub extern "C" fn vec_fst_add_trs_from_arrays(
+    fst: *mut CFst,
+    state: CStateId,
+    ilabels: *const libc::size_t,
+    olabels: *const libc::size_t,
+    weights: *const libc::c_float,
+    nextstates: *const libc::size_t,
+    num_trs: libc::size_t,
+) -> RUSTFST_FFI_RESULT {
+    wrap(|| {
+        let fst = get_mut!(CFst, fst);
+        let vec_fst = as_mut_fst!(VectorFst<TropicalWeight>, fst);
+        if num_trs == 0 {
+            return Ok(());
+        }
+        let ilabels = unsafe { std::slice::from_raw_parts(ilabels, num_trs) };
+        let olabels = unsafe { std::slice::from_raw_parts(olabels, num_trs) };
+        let weights = unsafe { std::slice::from_raw_parts(weights, num_trs) };
+        let nextstates = unsafe { std::slice::from_raw_parts(nextstates, num_trs) };
+        vec_fst.reserve_trs(state, num_trs)?;
+        let columns = ilabels.iter().zip(olabels).zip(weights).zip(nextstates);
+        for (((&ilabel, &olabel), &weight), &nextstate) in columns {
+            let ilabel = Label::try_from(ilabel)
+                .map_err(|_| format_err!("Input label {} doesn't fit in a Label", ilabel))?;
+            let olabel = Label::try_from(olabel)
+                .map_err(|_| format_err!("Output label {} doesn't fit in a Label", olabel))?;
+            let nextstate = StateId::try_from(nextstate)
+                .map_err(|_| format_err!("Next state {} doesn't fit in a StateId", nextstate))?;
+            vec_fst.add_tr(state, Tr::new(ilabel, olabel, weight, nextstate))?;
+        }
+        Ok(())
+    })
+}
+
+#[no_mangle]
+pub extern "C" fn vec_fst_reserve_trs(
+    fst: *mut CFst,
+    state: CStateId,
+    additional: libc::size_t,
+) -> RUSTFST_FFI_RESULT {
+    wrap(|| {
+        let fst = get_mut!(CFst, fst);
+        let vec_fst = as_mut_fst!(VectorFst<TropicalWeight>, fst);
+        vec_fst.try_reserve_trs(state, additional)?;
+        Ok(())
+    })
+}
+
+#[no_mangle]
+pub extern "C" fn vec_fst_reserve_states(
+    fst: *mut CFst,
+    additional: libc::size_t,
+) -> RUSTFST_FFI_RESULT {
+    wrap(|| {
+        let fst = get_mut!(CFst, fst);
+        let vec_fst = as_mut_fst!(VectorFst<TropicalWeight>, fst);
+        vec_fst.try_reserve_states(additional)?;
+        Ok(())
+    })
+}
+
+#[no_mangle]
+pub extern "C" fn vec_fst_del_final_weight(fst: *mut CFst, state: CStateId) -> RUSTFST_FFI_RESULT {
     wrap(|| {
         let fst = get_mut!(CFst, fst);
         let vec_fst = as_mut_fst!(VectorFst<TropicalWeight>, fst);
@@ -84,7 +197,10 @@ pub fn vec_fst_del_final_weight(fst: *mut CFst, state: CStateId) -> RUSTFST_FFI_
 }
 
 #[no_mangle]
-pub fn vec_fst_from_path(ptr: *mut *const CFst, path: *const libc::c_char) -> RUSTFST_FFI_RESULT {
+pub extern "C" fn vec_fst_from_path(
+    ptr: *mut *const CFst,
+    path: *const libc::c_char,
+) -> RUSTFST_FFI_RESULT {
     wrap(|| {
         let path = unsafe { CStr::from_ptr(path) }.as_rust()?;
         let fst = Box::new(VectorFst::<TropicalWeight>::read(&path)?);
@@ -95,7 +211,24 @@ pub fn vec_fst_from_path(ptr: *mut *const CFst, path: *const libc::c_char) -> RU
 }
 
 #[no_mangle]
-pub fn vec_fst_write_file(fst: *const CFst, path: *const libc::c_char) -> RUSTFST_FFI_RESULT {
+pub extern "C" fn vec_fst_from_path_mmap(
+    ptr: *mut *const CFst,
+    path: *const libc::c_char,
+) -> RUSTFST_FFI_RESULT {
+    wrap(|| {
+        let path = unsafe { CStr::from_ptr(path) }.as_rust()?;
+        let fst = read_mmap::<TropicalWeight, VectorFst<TropicalWeight>, _>(&path)?;
+        let raw_pointer = CFst(Box::new(fst)).into_raw_pointer();
+        unsafe { *ptr = raw_pointer };
+        Ok(())
+    })
+}
+
+#[no_mangle]
+pub extern "C" fn vec_fst_write_file(
+    fst: *const CFst,
+    path: *const libc::c_char,
+) -> RUSTFST_FFI_RESULT {
     wrap(|| {
         let fst = get!(CFst, fst);
         let path = unsafe { CStr::from_ptr(path) }.as_rust()?;
@@ -106,7 +239,7 @@ pub fn vec_fst_write_file(fst: *const CFst, path: *const libc::c_char) -> RUSTFS
 }
 
 #[no_mangle]
-pub fn vec_fst_relabel_tables(
+pub extern "C" fn vec_fst_relabel_tables(
     fst: *mut CFst,
     old_isymbols: *const CSymbolTable,
     new_isymbols: *const CSymbolTable,
@@ -144,7 +277,7 @@ pub fn vec_fst_relabel_tables(
 
 #[allow(clippy::too_many_arguments)]
 #[no_mangle]
-pub fn vec_fst_draw(
+pub extern "C" fn vec_fst_draw(
     fst_ptr: *mut CFst,
     isyms: *const CSymbolTable,
     osyms: *const CSymbolTable,
@@ -160,6 +293,30 @@ pub fn vec_fst_draw(
     fontsize: libc::size_t,
     show_weight_one: libc::size_t,
     print_weight: libc::size_t,
+) -> RUSTFST_FFI_RESULT {
+    let config = CDrawingConfig {
+        width,
+        height,
+        ranksep,
+        nodesep,
+        acceptor,
+        portrait,
+        vertical,
+        fontsize,
+        show_weight_one,
+        print_weight,
+    };
+    vec_fst_draw_with_config(fst_ptr, isyms, osyms, fname, title, &config)
+}
+
+#[no_mangle]
+pub extern "C" fn vec_fst_draw_with_config(
+    fst_ptr: *mut CFst,
+    isyms: *const CSymbolTable,
+    osyms: *const CSymbolTable,
+    fname: *const libc::c_char,
+    title: *const libc::c_char,
+    config: *const CDrawingConfig,
 ) -> RUSTFST_FFI_RESULT {
     wrap(|| {
         let fst = get_mut!(CFst, fst_ptr);
@@ -175,22 +332,9 @@ pub fn vec_fst_draw(
             vec_fst.fst_set_output_symbols(osymt.clone());
         }
 
-        let drawing_config = DrawingConfig {
-            vertical: vertical > 0,
-            size: if width >= 0.0 && height >= 0.0 {
-                Some((width, height))
-            } else {
-                None
-            },
-            title: unsafe { CStr::from_ptr(title).as_rust()? },
-            portrait: portrait > 0,
-            ranksep: if ranksep >= 0.0 { Some(ranksep) } else { None },
-            nodesep: if nodesep >= 0.0 { Some(nodesep) } else { None },
-            fontsize: fontsize as u32,
-            acceptor: acceptor > 0,
-            show_weight_one: show_weight_one > 0,
-            print_weight: print_weight > 0,
-        };
+        let config =
+            unsafe { config.as_ref() }.ok_or_else(|| anyhow!("Drawing config ptr is null"))?;
+        let drawing_config = config.to_drawing_config(unsafe { CStr::from_ptr(title).as_rust()? });
 
         vec_fst.draw(unsafe { CStr::from_ptr(fname).as_rust()? }, &drawing_config)?;
 
@@ -199,7 +343,10 @@ pub fn vec_fst_draw(
 }
 
 #[no_mangle]
-pub fn vec_fst_num_states(fst: *const CFst, num_states: *mut libc::size_t) -> RUSTFST_FFI_RESULT {
+pub extern "C" fn vec_fst_num_states(
+    fst: *const CFst,
+    num_states: *mut libc::size_t,
+) -> RUSTFST_FFI_RESULT {
     wrap(|| {
         let fst = get!(CFst, fst);
         let vec_fst = as_fst!(VectorFst<TropicalWeight>, fst);
@@ -210,7 +357,7 @@ pub fn vec_fst_num_states(fst: *const CFst, num_states: *mut libc::size_t) -> RU
 }
 
 #[no_mangle]
-pub fn vec_fst_equals(
+pub extern "C" fn vec_fst_equals(
     fst: *const CFst,
     other_fst: *const CFst,
     is_equal: *mut libc::size_t,
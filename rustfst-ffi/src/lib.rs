@@ -1,6 +1,7 @@
 #![allow(clippy::single_component_path_imports)]
 
 pub mod algorithms;
+pub mod drawing_config;
 pub mod fst;
 pub mod iterators;
 pub mod string_path;
@@ -14,7 +15,7 @@ use std::ffi::CString;
 use std::sync::Arc;
 
 use anyhow::Result;
-use ffi_convert::{CReprOf, RawPointerConverter};
+use ffi_convert::{CArray, CReprOf, RawPointerConverter};
 
 #[cfg(feature = "rustfst-state-label-u32")]
 pub type CLabel = libc::c_uint;
@@ -81,6 +82,15 @@ pub unsafe extern "C" fn rustfst_destroy_string(string: *mut libc::c_char) -> RU
     })
 }
 
+#[allow(clippy::missing_safety_doc)]
+#[no_mangle]
+pub unsafe extern "C" fn rustfst_destroy_bytes(bytes: *mut CArray<u8>) -> RUSTFST_FFI_RESULT {
+    wrap(|| {
+        CArray::<u8>::drop_raw_pointer(bytes)?;
+        Ok(())
+    })
+}
+
 macro_rules! get_mut {
     ($typ:ty,$opaque:ident) => {{
         &mut unsafe { <$typ as ffi_convert::RawBorrowMut<$typ>>::raw_borrow_mut($opaque) }?.0
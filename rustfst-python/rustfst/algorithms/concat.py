@@ -23,6 +23,7 @@ def concat(fst: VectorFst, other_fst: VectorFst) -> VectorFst:
     ret_code = lib.fst_concat(fst.ptr, other_fst.ptr)
     err_msg = "Error during concat"
     check_ffi_error(ret_code, err_msg)
+    fst.invalidate_num_states()
 
     return fst
 
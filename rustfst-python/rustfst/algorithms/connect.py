@@ -31,5 +31,6 @@ def connect(fst: VectorFst) -> VectorFst:
     ret_code = lib.fst_connect(fst.ptr, ctypes.byref(connectd_fst))
     err_msg = "Error during connect"
     check_ffi_error(ret_code, err_msg)
+    fst.invalidate_num_states()
 
     return VectorFst(ptr=connectd_fst)
@@ -19,6 +19,7 @@ def optimize(fst: VectorFst):
     ret_code = lib.fst_optimize(fst.ptr)
     err_msg = "Error during optimize"
     check_ffi_error(ret_code, err_msg)
+    fst.invalidate_num_states()
 
 
 def optimize_in_log(fst: VectorFst):
@@ -30,3 +31,4 @@ def optimize_in_log(fst: VectorFst):
     ret_code = lib.fst_optimize_in_log(ctypes.byref(fst.ptr))
     err_msg = "Error during optimize_in_log"
     check_ffi_error(ret_code, err_msg)
+    fst.invalidate_num_states()
@@ -0,0 +1,38 @@
+from __future__ import annotations
+import ctypes
+from typing import Optional
+
+from rustfst.ffi_utils import (
+    lib,
+    check_ffi_error,
+)
+
+from rustfst.fst.vector_fst import VectorFst
+
+KDELTA = 1.0 / 1024.0
+
+
+def quantize(fst: VectorFst, delta: Optional[float] = None) -> VectorFst:
+    """
+    Quantize in place the weights of the trs and of the final states of an Fst:
+    each weight is rounded to the closest multiple of `delta`. Infinite weights are
+    left untouched.
+
+    This is lossy: the weights only keep a precision of `delta`. The binary format
+    is unchanged and still stores the weights as 32 bits floats, so quantizing
+    doesn't change the size of the written file.
+
+    Args:
+        fst: Fst to quantize.
+        delta: Quantization step. Defaults to `KDELTA`.
+    Returns:
+        The quantized Fst.
+    """
+    if delta is None:
+        delta = KDELTA
+
+    ret_code = lib.fst_quantize(fst.ptr, ctypes.c_float(delta))
+    err_msg = "Error during quantize"
+    check_ffi_error(ret_code, err_msg)
+
+    return fst
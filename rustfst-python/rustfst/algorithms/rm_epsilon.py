@@ -20,5 +20,6 @@ def rm_epsilon(fst: VectorFst):
     ret_code = lib.fst_rm_epsilon(fst.ptr, ctypes.byref(rm_epsilon_fst))
     err_msg = "Error during rm_epsilon"
     check_ffi_error(ret_code, err_msg)
+    fst.invalidate_num_states()
 
     return VectorFst(ptr=rm_epsilon_fst)
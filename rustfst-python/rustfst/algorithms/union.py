@@ -1,4 +1,5 @@
 from __future__ import annotations
+import ctypes
 
 from typing import List
 
@@ -40,6 +41,7 @@ def union(fst: VectorFst, other_fst: VectorFst) -> VectorFst:
     ret_code = lib.fst_union(fst.ptr, other_fst.ptr)
     err_msg = "Error during union"
     check_ffi_error(ret_code, err_msg)
+    fst.invalidate_num_states()
 
     return fst
 
@@ -47,6 +49,8 @@ def union(fst: VectorFst, other_fst: VectorFst) -> VectorFst:
 def union_list(fsts: List[VectorFst]) -> VectorFst:
     """
     Computes the union of a list of Fsts.
+    The whole union is built on the Rust side in a single call: the input Fsts
+    are left untouched and the states of the result are allocated once upfront.
 
     Args:
         fsts: The list of Fsts to produce the union.
@@ -57,8 +61,14 @@ def union_list(fsts: List[VectorFst]) -> VectorFst:
     """
     if not fsts:
         raise ValueError("fsts must be at least of len 1")
-    fsts = [f.copy() for f in fsts]
-    res_fst = fsts[0]
-    for f in fsts[1:]:
-        res_fst = union(res_fst, f)
-    return res_fst
+    fsts_ptr = (ctypes.c_void_p * len(fsts))(
+        *[ctypes.cast(f.ptr, ctypes.c_void_p) for f in fsts]
+    )
+    union_fst = ctypes.pointer(ctypes.c_void_p())
+    ret_code = lib.fst_union_list(
+        fsts_ptr, ctypes.c_size_t(len(fsts)), ctypes.byref(union_fst)
+    )
+    err_msg = "Error during union_list"
+    check_ffi_error(ret_code, err_msg)
+
+    return VectorFst(ptr=union_fst)
@@ -1,6 +1,26 @@
+import ctypes
 from typing import Optional
 
 
+class CDrawingConfig(ctypes.Structure):
+    _fields_ = [
+        ("width", ctypes.c_float),
+        ("height", ctypes.c_float),
+        ("ranksep", ctypes.c_float),
+        ("nodesep", ctypes.c_float),
+        ("acceptor", ctypes.c_size_t),
+        ("portrait", ctypes.c_size_t),
+        ("vertical", ctypes.c_size_t),
+        ("fontsize", ctypes.c_size_t),
+        ("show_weight_one", ctypes.c_size_t),
+        ("print_weight", ctypes.c_size_t),
+    ]
+
+
+def _or_unset(value: Optional[float]) -> float:
+    return -1.0 if value is None else value
+
+
 class DrawingConfig:
     def __init__(
         self,
@@ -32,6 +52,7 @@ class DrawingConfig:
             show_weight_one: Should weights equivalent to semiring One be printed?
             print_weight: Should weights be printed
         """
+        self._c_config = None
         self.acceptor = acceptor
         self.title = title
         self.width = width
@@ -43,3 +64,46 @@ class DrawingConfig:
         self.fontsize = fontsize
         self.show_weight_one = show_weight_one
         self.print_weight = print_weight
+
+    @property
+    def title(self) -> str:
+        return self._title
+
+    @title.setter
+    def title(self, value: str):
+        self._title = value
+        # Encoded once here rather than every time the config is used to draw.
+        self._title_bytes = value.encode("utf-8")
+
+    @property
+    def title_bytes(self) -> bytes:
+        """
+        The title encoded in utf-8, as passed to the FFI.
+        """
+        return self._title_bytes
+
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        # Any change of the config invalidates its cached C representation.
+        if name != "_c_config":
+            super().__setattr__("_c_config", None)
+
+    def to_c(self) -> CDrawingConfig:
+        """
+        Returns the C representation of the config passed to the FFI, built once and
+        cached until the config is modified.
+        """
+        if self._c_config is None:
+            self._c_config = CDrawingConfig(
+                width=_or_unset(self.width),
+                height=_or_unset(self.height),
+                ranksep=_or_unset(self.ranksep),
+                nodesep=_or_unset(self.nodesep),
+                acceptor=self.acceptor,
+                portrait=self.portrait,
+                vertical=self.vertical,
+                fontsize=self.fontsize,
+                show_weight_one=self.show_weight_one,
+                print_weight=self.print_weight,
+            )
+        return self._c_config
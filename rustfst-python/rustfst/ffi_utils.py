@@ -1,4 +1,5 @@
 from contextlib import contextmanager
+from functools import lru_cache
 from ctypes import (
     cdll,
     c_char_p,
@@ -20,6 +21,19 @@ lib = cdll.LoadLibrary(str(dylib_path))
 PathOrStr = Union[Path, str]
 
 
+@lru_cache(maxsize=256)
+def _encode_str(s: str) -> bytes:
+    return s.encode("utf-8")
+
+
+def encode_path(path: PathOrStr) -> bytes:
+    """
+    Encode a path to the null terminated utf-8 bytes expected by the FFI.
+    Recently used paths are cached to avoid re-encoding them on every call.
+    """
+    return _encode_str(str(path))
+
+
 class CStringArray(Structure):
     _fields_ = [("data", POINTER(c_char_p)), ("size", c_int32)]
 
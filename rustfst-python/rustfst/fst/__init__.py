@@ -137,7 +137,9 @@ class Fst:
         check_ffi_error(ret_code, err_msg)
 
         if table.contents:
-            return SymbolTable(ptr=table)
+            # Cache the wrapper to avoid a new FFI call and allocation on the next call.
+            self._input_symbols = SymbolTable(ptr=table)
+            return self._input_symbols
         return None
 
     def output_symbols(self) -> Optional[SymbolTable]:
@@ -157,7 +159,9 @@ class Fst:
         check_ffi_error(ret_code, err_msg)
 
         if table.contents:
-            return SymbolTable(ptr=table)
+            # Cache the wrapper to avoid a new FFI call and allocation on the next call.
+            self._output_symbols = SymbolTable(ptr=table)
+            return self._output_symbols
         return None
 
     def set_input_symbols(self, syms: Optional[SymbolTable]) -> Fst:
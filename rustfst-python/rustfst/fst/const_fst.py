@@ -3,6 +3,7 @@ import ctypes
 from rustfst.ffi_utils import (
     lib,
     check_ffi_error,
+    encode_path,
 )
 
 from rustfst.fst import Fst
@@ -44,47 +45,25 @@ class ConstFst(Fst):
         isymbols_ptr = isymbols.ptr if isymbols is not None else None
         osymbols_ptr = osymbols.ptr if osymbols is not None else None
 
-        if drawing_config.width is None:
-            width = ctypes.c_float(-1.0)
-        else:
-            width = ctypes.c_float(drawing_config.width)
-
-        if drawing_config.height is None:
-            height = ctypes.c_float(-1.0)
-        else:
-            height = ctypes.c_float(drawing_config.height)
-
-        if drawing_config.ranksep is None:
-            ranksep = ctypes.c_float(-1.0)
-        else:
-            ranksep = ctypes.c_float(drawing_config.ranksep)
-
-        if drawing_config.nodesep is None:
-            nodesep = ctypes.c_float(-1.0)
-        else:
-            nodesep = ctypes.c_float(drawing_config.nodesep)
-
-        ret_code = lib.const_fst_draw(
+        ret_code = lib.const_fst_draw_with_config(
             self.ptr,
             isymbols_ptr,
             osymbols_ptr,
-            filename.encode("utf-8"),
-            drawing_config.title.encode("utf-8"),
-            ctypes.c_size_t(drawing_config.acceptor),
-            width,
-            height,
-            ctypes.c_size_t(drawing_config.portrait),
-            ctypes.c_size_t(drawing_config.vertical),
-            ranksep,
-            nodesep,
-            ctypes.c_size_t(drawing_config.fontsize),
-            ctypes.c_size_t(drawing_config.show_weight_one),
-            ctypes.c_size_t(drawing_config.print_weight),
+            encode_path(filename),
+            drawing_config.title_bytes,
+            ctypes.byref(drawing_config.to_c()),
         )
 
         err_msg = "fst draw failed"
         check_ffi_error(ret_code, err_msg)
 
+        # The symbol tables used for drawing are attached to the Fst, keep the cached
+        # ones in sync.
+        if isymbols is not None:
+            self._input_symbols = isymbols
+        if osymbols is not None:
+            self._output_symbols = osymbols
+
     @classmethod
     def read(cls, filename: Union[str, Path]) -> ConstFst:
         """
@@ -97,9 +76,7 @@ class ConstFst(Fst):
           ValueError: Read failed.
         """
         fst = ctypes.pointer(ctypes.c_void_p())
-        ret_code = lib.const_fst_from_path(
-            ctypes.byref(fst), str(filename).encode("utf-8")
-        )
+        ret_code = lib.const_fst_from_path(ctypes.byref(fst), encode_path(filename))
         err_msg = f"Read failed. file: {filename}"
         check_ffi_error(ret_code, err_msg)
 
@@ -114,7 +91,7 @@ class ConstFst(Fst):
         Raises:
           ValueError: Write failed.
         """
-        ret_code = lib.const_fst_write_file(self.ptr, str(filename).encode("utf-8"))
+        ret_code = lib.const_fst_write_file(self.ptr, encode_path(filename))
         err_msg = f"Write failed. file: {filename}"
         check_ffi_error(ret_code, err_msg)
 
@@ -1,24 +1,130 @@
 from __future__ import annotations
 import ctypes
+import struct
+import sys
+import threading
 
 from rustfst.string_paths_iterator import StringPathsIterator
 from rustfst.ffi_utils import (
     lib,
     check_ffi_error,
+    encode_path,
 )
 
 from rustfst.fst import Fst
 from rustfst.symbol_table import SymbolTable
 from rustfst.drawing_config import DrawingConfig
-from rustfst.iterators import MutableTrsIterator, StateIterator
+from rustfst.iterators import MutableTrsIterator
 from rustfst.tr import Tr
 from rustfst.weight import weight_one
-from typing import Optional, Union
+from typing import Iterator, Optional, Sequence, Union
 from pathlib import Path
 
 from typing import List
 
 
+def _prototype(func, *argtypes):
+    """
+    Declares the C signature of a `vec_fst_*` FFI function. Prototyped functions
+    convert their arguments natively instead of going through the generic ctypes
+    conversion path on every call, and can be called with plain Python values.
+    """
+    func.argtypes = list(argtypes)
+    func.restype = ctypes.c_int
+    return func
+
+
+_PTR = ctypes.c_void_p
+_SIZE = ctypes.c_size_t
+_FLOAT = ctypes.c_float
+_STR = ctypes.c_char_p
+
+_vec_fst_new = _prototype(lib.vec_fst_new, _PTR)
+_vec_fst_add_tr = _prototype(lib.vec_fst_add_tr, _PTR, _SIZE, _PTR)
+_vec_fst_add_trs = _prototype(lib.vec_fst_add_trs, _PTR, _SIZE, _PTR, _SIZE)
+_vec_fst_add_trs_from_arrays = _prototype(
+    lib.vec_fst_add_trs_from_arrays, _PTR, _SIZE, _PTR, _PTR, _PTR, _PTR, _SIZE
+)
+_vec_fst_add_state = _prototype(lib.vec_fst_add_state, _PTR, _PTR)
+_vec_fst_add_states = _prototype(lib.vec_fst_add_states, _PTR, _SIZE, _PTR)
+_vec_fst_set_final = _prototype(lib.vec_fst_set_final, _PTR, _SIZE, _FLOAT)
+_vec_fst_reserve_trs = _prototype(lib.vec_fst_reserve_trs, _PTR, _SIZE, _SIZE)
+_vec_fst_reserve_states = _prototype(lib.vec_fst_reserve_states, _PTR, _SIZE)
+_vec_fst_del_final_weight = _prototype(lib.vec_fst_del_final_weight, _PTR, _SIZE)
+_vec_fst_delete_states = _prototype(lib.vec_fst_delete_states, _PTR)
+_vec_fst_num_states = _prototype(lib.vec_fst_num_states, _PTR, _PTR)
+_vec_fst_set_start = _prototype(lib.vec_fst_set_start, _PTR, _SIZE)
+_vec_fst_relabel_tables = _prototype(
+    lib.vec_fst_relabel_tables, _PTR, _PTR, _PTR, _SIZE, _PTR, _PTR, _SIZE
+)
+_vec_fst_draw_with_config = _prototype(
+    lib.vec_fst_draw_with_config, _PTR, _PTR, _PTR, _STR, _STR, _PTR
+)
+_vec_fst_from_path = _prototype(lib.vec_fst_from_path, _PTR, _STR)
+_vec_fst_from_path_mmap = _prototype(lib.vec_fst_from_path_mmap, _PTR, _STR)
+_vec_fst_write_file = _prototype(lib.vec_fst_write_file, _PTR, _STR)
+_vec_fst_equals = _prototype(lib.vec_fst_equals, _PTR, _PTR, _PTR)
+_vec_fst_copy = _prototype(lib.vec_fst_copy, _PTR, _PTR)
+
+
+def _buffer_formats(ctype, codes: str) -> frozenset:
+    """
+    Buffer formats (as reported by `memoryview.format`) with the same in-memory
+    representation as `ctype`, among the given struct format characters.
+    """
+    size = ctypes.sizeof(ctype)
+    prefixes = ("", "@", "=", "<" if sys.byteorder == "little" else ">")
+    return frozenset(
+        prefix + code
+        for prefix in prefixes
+        for code in codes
+        if struct.calcsize(prefix + code) == size
+    )
+
+
+_SIZE_FORMATS = _buffer_formats(_SIZE, "iIlLqQ")
+_FLOAT_FORMATS = _buffer_formats(_FLOAT, "f")
+
+
+def _as_c_array(values, ctype, formats: frozenset):
+    """
+    Converts a column of values to a ctypes array of `ctype`. One dimensional
+    contiguous buffers (`array.array`, numpy arrays...) with a matching item type
+    are used as is (or copied in one go when read-only), other sequences are
+    converted element by element.
+    """
+    try:
+        view = memoryview(values)
+    except TypeError:
+        return (ctype * len(values))(*values)
+    if view.ndim != 1 or not view.c_contiguous or view.format not in formats:
+        return (ctype * len(view))(*view.tolist())
+    array_type = ctype * len(view)
+    if view.readonly:
+        return array_type.from_buffer_copy(view)
+    return array_type.from_buffer(view)
+
+
+# Semiring One, used as default final weight.
+_WEIGHT_ONE = weight_one()
+
+# Per-thread `c_size_t` (and a pointer to it) reused as output parameter of the FFI
+# calls, instead of allocating a fresh ctypes object on every call.
+_SCRATCH = threading.local()
+
+
+def _scratch_size_t():
+    scratch = getattr(_SCRATCH, "size_t", None)
+    if scratch is None:
+        value = ctypes.c_size_t()
+        scratch = _SCRATCH.size_t = (value, ctypes.pointer(value))
+    else:
+        # Outputs of type `CStateId` may be narrower than a `size_t` and then only
+        # overwrite its lower bytes: clear what the previous call left.
+        scratch[0].value = 0
+    return scratch
+
+
 class VectorFst(Fst):
     def __init__(self, ptr=None):
         """
@@ -26,6 +132,9 @@ class VectorFst(Fst):
         """
         self._input_symbols = None
         self._output_symbols = None
+        # Number of states, maintained on the Python side by the methods adding or
+        # removing states. `None` when unknown, it is then fetched from the Fst.
+        self._num_states = None
 
         if ptr:
             self.ptr = ptr
@@ -48,11 +157,12 @@ class VectorFst(Fst):
 
         else:
             fst_ptr = ctypes.pointer(ctypes.c_void_p())
-            ret_code = lib.vec_fst_new(ctypes.byref(fst_ptr))
+            ret_code = _vec_fst_new(ctypes.byref(fst_ptr))
 
             err_msg = "Something went wrong when creating the Fst struct"
             check_ffi_error(ret_code, err_msg)
             self.ptr = fst_ptr
+            self._num_states = 0
 
         super().__init__(self.ptr, self._input_symbols, self._output_symbols)
 
@@ -69,12 +179,82 @@ class VectorFst(Fst):
           SnipsFstException: If State index out of range.
         See also: `add_state`.
         """
-        ret_code = lib.vec_fst_add_tr(self.ptr, ctypes.c_size_t(state), tr.ptr)
+        ret_code = _vec_fst_add_tr(self.ptr, state, tr.ptr)
         err_msg = "Error during `add_tr`"
         check_ffi_error(ret_code, err_msg)
 
         return self
 
+    def add_trs(self, state: int, trs: List[Tr]) -> Fst:
+        """
+        Adds several trs leaving the same state to the FST and return self.
+        All the trs are passed to the FST in a single call, which is much faster
+        than calling `add_tr` in a loop when building large FSTs.
+        Args:
+          state: The integer index of the source state.
+          trs: The trs to add.
+        Returns:
+          self.
+        Raises:
+          SnipsFstException: If State index out of range.
+        See also: `add_tr`.
+        """
+        trs_ptr = (ctypes.c_void_p * len(trs))(*[tr.ptr for tr in trs])
+        ret_code = _vec_fst_add_trs(self.ptr, state, trs_ptr, len(trs))
+        err_msg = "Error during `add_trs`"
+        check_ffi_error(ret_code, err_msg)
+
+        return self
+
+    def add_trs_arrays(
+        self,
+        state: int,
+        ilabels: Sequence[int],
+        olabels: Sequence[int],
+        weights: Sequence[float],
+        nextstates: Sequence[int],
+    ) -> Fst:
+        """
+        Adds several trs leaving the same state to the FST and return self.
+        The trs are described column-wise: the i-th tr goes from `state` to
+        `nextstates[i]` with labels `ilabels[i]`, `olabels[i]` and weight `weights[i]`.
+        Unlike `add_trs`, no `Tr` object needs to be created. Columns exposing the
+        buffer protocol (`array.array`, numpy arrays...) holding 64 bits integers
+        for the labels and states and 32 bits floats for the weights are
+        passed to the FST without converting each element in Python.
+        Args:
+          state: The integer index of the source state.
+          ilabels: The input labels of the trs.
+          olabels: The output labels of the trs.
+          weights: The weights of the trs.
+          nextstates: The destination states of the trs.
+        Returns:
+          self.
+        Raises:
+          ValueError: If the sequences don't have the same length, a label or a state
+            doesn't fit in a `Label` or a `StateId`, or State index out of range.
+        See also: `add_trs`.
+        """
+        num_trs = len(ilabels)
+        if not len(olabels) == len(weights) == len(nextstates) == num_trs:
+            raise ValueError(
+                "ilabels, olabels, weights and nextstates must have the same length"
+            )
+
+        ret_code = _vec_fst_add_trs_from_arrays(
+            self.ptr,
+            state,
+            _as_c_array(ilabels, _SIZE, _SIZE_FORMATS),
+            _as_c_array(olabels, _SIZE, _SIZE_FORMATS),
+            _as_c_array(weights, _FLOAT, _FLOAT_FORMATS),
+            _as_c_array(nextstates, _SIZE, _SIZE_FORMATS),
+            num_trs,
+        )
+        err_msg = "Error during `add_trs_arrays`"
+        check_ffi_error(ret_code, err_msg)
+
+        return self
+
     def add_state(self) -> int:
         """
         Adds a new state to the FST and returns the state ID.
@@ -82,14 +262,81 @@ class VectorFst(Fst):
           The integer index of the new state.
         See also: `add_tr`, `set_start`, `set_final`.
         """
-        state_id = ctypes.c_size_t()
+        state_id, state_id_ptr = _scratch_size_t()
 
-        ret_code = lib.vec_fst_add_state(self.ptr, ctypes.byref(state_id))
+        ret_code = _vec_fst_add_state(self.ptr, state_id_ptr)
         err_msg = "Error during `add_state`"
         check_ffi_error(ret_code, err_msg)
 
+        if self._num_states is not None:
+            self._num_states += 1
+
         return state_id.value
 
+    def add_states(self, num_states: int) -> int:
+        """
+        Adds `num_states` new states to the FST in a single call and returns the ID
+        of the first one. The new states have contiguous IDs, from the returned ID
+        to the returned ID + `num_states` - 1.
+        Args:
+          num_states: The number of states to add.
+        Returns:
+          The integer index of the first new state.
+        Raises:
+          ValueError: If `num_states` is negative or the new states can't be indexed.
+        See also: `add_state`.
+        """
+        if num_states < 0:
+            raise ValueError(f"num_states must be non-negative, got {num_states}")
+
+        first_state, first_state_ptr = _scratch_size_t()
+
+        ret_code = _vec_fst_add_states(self.ptr, num_states, first_state_ptr)
+        err_msg = "Error during `add_states`"
+        check_ffi_error(ret_code, err_msg)
+
+        if self._num_states is not None:
+            self._num_states += num_states
+
+        return first_state.value
+
+    def reserve_trs(self, state: int, additional: int):
+        """
+        Reserves capacity for at least `additional` more trs leaving a state, to
+        avoid reallocating its trs while they are being added.
+        Example: `fst.reserve_trs(s, len(trs)); fst.add_trs(s, trs)`.
+        Args:
+          state: The integer index of a state.
+          additional: The number of trs to reserve capacity for.
+        Raises:
+          ValueError: If `additional` is negative, the capacity overflows or State
+            index out of range.
+        See also: `reserve_states`.
+        """
+        if additional < 0:
+            raise ValueError(f"additional must be non-negative, got {additional}")
+
+        ret_code = _vec_fst_reserve_trs(self.ptr, state, additional)
+        err_msg = "Error during `reserve_trs`"
+        check_ffi_error(ret_code, err_msg)
+
+    def reserve_states(self, additional: int):
+        """
+        Reserves capacity for at least `additional` more states, to avoid
+        reallocating the states while they are being added.
+        Args:
+          additional: The number of states to reserve capacity for.
+        Raises:
+          ValueError: If `additional` is negative or the capacity overflows.
+        See also: `reserve_trs`.
+        """
+        if additional < 0:
+            raise ValueError(f"additional must be non-negative, got {additional}")
+
+        ret_code = _vec_fst_reserve_states(self.ptr, additional)
+        err_msg = "Error during `reserve_states`"
+        check_ffi_error(ret_code, err_msg)
+
     def set_final(self, state: int, weight: float = None):
         """
         Sets the final weight for a state.
@@ -102,12 +349,9 @@ class VectorFst(Fst):
         See also: `set_start`.
         """
         if weight is None:
-            weight = weight_one()
-
-        state = ctypes.c_size_t(state)
-        weight = ctypes.c_float(weight)
+            weight = _WEIGHT_ONE
 
-        ret_code = lib.vec_fst_set_final(self.ptr, state, weight)
+        ret_code = _vec_fst_set_final(self.ptr, state, weight)
         err_msg = "Error setting final state"
         check_ffi_error(ret_code, err_msg)
 
@@ -119,8 +363,7 @@ class VectorFst(Fst):
         Raises:
           ValueError: State index out of range.
         """
-        state = ctypes.c_size_t(state)
-        ret_code = lib.vec_fst_del_final_weight(self.ptr, state)
+        ret_code = _vec_fst_del_final_weight(self.ptr, state)
         err_msg = "Error unsetting final state"
         check_ffi_error(ret_code, err_msg)
 
@@ -137,25 +380,48 @@ class VectorFst(Fst):
 
     def delete_states(self):
         """
-        Delete all the states
+        Delete all the states.
+        The GIL is released while the states are deleted.
         """
-        ret_code = lib.vec_fst_delete_states(self.ptr)
+        ret_code = _vec_fst_delete_states(self.ptr)
         err_msg = "Error deleting states"
         check_ffi_error(ret_code, err_msg)
 
+        self._num_states = 0
+
     def num_states(self) -> int:
         """
         Returns the number of states.
+        The value is tracked on the Python side, so this doesn't cross the FFI
+        boundary once the number of states is known.
         Returns:
             Number of states present in the Fst.
         """
-        num_states = ctypes.c_size_t()
-        ret_code = lib.vec_fst_num_states(self.ptr, ctypes.byref(num_states))
+        if self._num_states is None:
+            self._num_states = self.num_states_ffi()
+        return self._num_states
+
+    def num_states_ffi(self) -> int:
+        """
+        Returns the number of states, as reported by the underlying Fst.
+        Returns:
+            Number of states present in the Fst.
+        See also: `num_states`.
+        """
+        num_states, num_states_ptr = _scratch_size_t()
+        ret_code = _vec_fst_num_states(self.ptr, num_states_ptr)
         err_msg = "Error getting number of states"
         check_ffi_error(ret_code, err_msg)
 
         return int(num_states.value)
 
+    def invalidate_num_states(self):
+        """
+        Forgets the number of states tracked on the Python side. To be called after
+        any operation that adds or removes states without going through this class.
+        """
+        self._num_states = None
+
     def set_start(self, state: int):
         """
         Sets a state to be the initial state state.
@@ -165,19 +431,29 @@ class VectorFst(Fst):
           ValueError: If State index out of range.
         See also: `set_final`.
         """
-        state_id = ctypes.c_size_t(state)
-        ret_code = lib.vec_fst_set_start(self.ptr, state_id)
+        ret_code = _vec_fst_set_start(self.ptr, state)
         err_msg = "Error setting start state"
         check_ffi_error(ret_code, err_msg)
 
-    def states(self) -> StateIterator:
+    def states(self) -> Iterator[int]:
         """
         Returns an iterator over all states in the FST.
         Returns:
-          A StateIterator object for the FST.
-        See also: `trs`, `mutable_trs`.
+          An iterator over the state IDs of the FST.
+        See also: `state_ids`, `trs`, `mutable_trs`.
         """
-        return StateIterator(self)
+        return iter(self.state_ids())
+
+    def state_ids(self) -> range:
+        """
+        Returns the IDs of all the states in the FST.
+        The states of a VectorFst are always numbered from 0 to `num_states() - 1`,
+        so the IDs are returned as a `range` without iterating over the FST.
+        Returns:
+          The range of the state IDs of the FST.
+        See also: `states`.
+        """
+        return range(self.num_states())
 
     def relabel_tables(
         self,
@@ -212,14 +488,14 @@ class VectorFst(Fst):
         old_isymbols_ptr = old_isymbols.ptr if old_isymbols is not None else None
         old_osymbols_ptr = old_osymbols.ptr if old_osymbols is not None else None
 
-        ret_code = lib.vec_fst_relabel_tables(
+        ret_code = _vec_fst_relabel_tables(
             self.ptr,
             old_isymbols_ptr,
             new_isymbols.ptr,
-            ctypes.c_size_t(attach_new_isymbols),
+            attach_new_isymbols,
             old_osymbols_ptr,
             new_osymbols.ptr,
-            ctypes.c_size_t(attach_new_osymbols),
+            attach_new_osymbols,
         )
         err_msg = "Relabel tables failed"
         check_ffi_error(ret_code, err_msg)
@@ -248,6 +524,8 @@ class VectorFst(Fst):
         Writes out the FST in Graphviz text format.
         This method writes out the FST in the dot graph description language. The
         graph can be rendered using the `dot` executable provided by Graphviz.
+        The GIL is released while the FST is drawn, so several FSTs can be drawn in
+        parallel from different threads (e.g. with a `ThreadPoolExecutor`).
         Args:
           filename: The string location of the output dot/Graphviz file.
           isymbols: An optional symbol table used to label input symbols.
@@ -259,51 +537,30 @@ class VectorFst(Fst):
         isymbols_ptr = isymbols.ptr if isymbols is not None else None
         osymbols_ptr = osymbols.ptr if osymbols is not None else None
 
-        if drawing_config.width is None:
-            width = ctypes.c_float(-1.0)
-        else:
-            width = ctypes.c_float(drawing_config.width)
-
-        if drawing_config.height is None:
-            height = ctypes.c_float(-1.0)
-        else:
-            height = ctypes.c_float(drawing_config.height)
-
-        if drawing_config.ranksep is None:
-            ranksep = ctypes.c_float(-1.0)
-        else:
-            ranksep = ctypes.c_float(drawing_config.ranksep)
-
-        if drawing_config.nodesep is None:
-            nodesep = ctypes.c_float(-1.0)
-        else:
-            nodesep = ctypes.c_float(drawing_config.nodesep)
-
-        ret_code = lib.vec_fst_draw(
+        ret_code = _vec_fst_draw_with_config(
             self.ptr,
             isymbols_ptr,
             osymbols_ptr,
-            filename.encode("utf-8"),
-            drawing_config.title.encode("utf-8"),
-            ctypes.c_size_t(drawing_config.acceptor),
-            width,
-            height,
-            ctypes.c_size_t(drawing_config.portrait),
-            ctypes.c_size_t(drawing_config.vertical),
-            ranksep,
-            nodesep,
-            ctypes.c_size_t(drawing_config.fontsize),
-            ctypes.c_size_t(drawing_config.show_weight_one),
-            ctypes.c_size_t(drawing_config.print_weight),
+            encode_path(filename),
+            drawing_config.title_bytes,
+            ctypes.byref(drawing_config.to_c()),
         )
 
         err_msg = "fst draw failed"
         check_ffi_error(ret_code, err_msg)
 
+        # The symbol tables used for drawing are attached to the Fst, keep the cached
+        # ones in sync.
+        if isymbols is not None:
+            self._input_symbols = isymbols
+        if osymbols is not None:
+            self._output_symbols = osymbols
+
     @classmethod
     def read(cls, filename: Union[str, Path]) -> VectorFst:
         """
         Read a Fst at a given path.
+        The GIL is released while the file is read and parsed.
         Args:
           filename: The string location of the input file.
         Returns:
@@ -312,9 +569,29 @@ class VectorFst(Fst):
           ValueError: Read failed.
         """
         fst = ctypes.pointer(ctypes.c_void_p())
-        ret_code = lib.vec_fst_from_path(
-            ctypes.byref(fst), str(filename).encode("utf-8")
-        )
+        ret_code = _vec_fst_from_path(ctypes.byref(fst), encode_path(filename))
+        err_msg = f"Read failed. file: {filename}"
+        check_ffi_error(ret_code, err_msg)
+
+        return cls(ptr=fst)
+
+    @classmethod
+    def read_mmap(cls, filename: Union[str, Path]) -> VectorFst:
+        """
+        Read a Fst at a given path by mapping the file in memory.
+        The file content is parsed straight from the mapping instead of being first
+        copied to an intermediate buffer, which reduces the peak memory usage and the
+        loading time of large Fsts. The resulting Fst is a regular mutable `VectorFst`.
+        Args:
+          filename: The string location of the input file.
+        Returns:
+          An Fst.
+        Raises:
+          ValueError: Read failed.
+        See also: `read`.
+        """
+        fst = ctypes.pointer(ctypes.c_void_p())
+        ret_code = _vec_fst_from_path_mmap(ctypes.byref(fst), encode_path(filename))
         err_msg = f"Read failed. file: {filename}"
         check_ffi_error(ret_code, err_msg)
 
@@ -324,12 +601,13 @@ class VectorFst(Fst):
         """
         Serializes FST to a file.
         This method writes the FST to a file in vector binary format.
+        The GIL is released while the file is written.
         Args:
           filename: The string location of the output file.
         Raises:
           ValueError: Write failed.
         """
-        ret_code = lib.vec_fst_write_file(self.ptr, str(filename).encode("utf-8"))
+        ret_code = _vec_fst_write_file(self.ptr, encode_path(filename))
         err_msg = f"Write failed. file: {filename}"
         check_ffi_error(ret_code, err_msg)
 
@@ -359,7 +637,8 @@ class VectorFst(Fst):
 
     def to_bytes(self) -> bytes:
         """
-        Turns the `VectorFst` into bytes.
+        Turns the `VectorFst` into bytes, in the same binary format as `write` but
+        without going through the filesystem.
         Returns:
             Sequence of bytes.
         """
@@ -373,12 +652,12 @@ class VectorFst(Fst):
         error_msg = "`to_bytes` failed"
         check_ffi_error(ret_code, error_msg)
 
-        return bytes(
-            [
-                ctypes.c_ubyte.from_address(bytes_ptr.contents.data_ptr + i).value
-                for i in range(bytes_ptr.contents.size)
-            ]
-        )
+        c_bytes = bytes_ptr.contents
+        try:
+            # Single copy of the whole buffer owned by the Rust side.
+            return ctypes.string_at(c_bytes.data_ptr, c_bytes.size)
+        finally:
+            lib.rustfst_destroy_bytes(bytes_ptr)
 
     def equals(self, other: Fst) -> bool:
         """
@@ -388,9 +667,16 @@ class VectorFst(Fst):
         Returns:
              Whether both Fst are equals.
         """
-        is_equal = ctypes.c_size_t()
+        if self is other:
+            return True
+        # The number of states is known on the Python side: Fsts with different
+        # numbers of states are told apart without walking them.
+        if isinstance(other, VectorFst) and self.num_states() != other.num_states():
+            return False
+
+        is_equal, is_equal_ptr = _scratch_size_t()
 
-        ret_code = lib.vec_fst_equals(self.ptr, other.ptr, ctypes.byref(is_equal))
+        ret_code = _vec_fst_equals(self.ptr, other.ptr, is_equal_ptr)
         err_msg = "Error checking equality"
         check_ffi_error(ret_code, err_msg)
 
@@ -402,7 +688,7 @@ class VectorFst(Fst):
             A copy of the Fst.
         """
         cloned_fst = ctypes.pointer(ctypes.c_void_p())
-        ret_code = lib.vec_fst_copy(self.ptr, ctypes.byref(cloned_fst))
+        ret_code = _vec_fst_copy(self.ptr, ctypes.byref(cloned_fst))
         err_msg = "Error copying fst"
         check_ffi_error(ret_code, err_msg)
 
@@ -523,6 +809,28 @@ class VectorFst(Fst):
 
         return union(self, other_fst)
 
+    @classmethod
+    def from_shards(cls, shards: List[VectorFst]) -> VectorFst:
+        """
+        Merge Fsts built independently (for instance one per worker) into a single Fst
+        accepting the union of their paths. The merge happens in one call on the Rust
+        side, with the GIL released, and the shards are left untouched.
+        Args:
+            shards: The list of Fsts to merge. Must not be empty.
+        Returns:
+            The merged Fst.
+        See also: `rustfst.algorithms.union.union_list`.
+        """
+        from rustfst.algorithms.union import union_list
+
+        return union_list(shards)
+
+    def quantize(self, delta: Optional[float] = None) -> VectorFst:
+        from rustfst.algorithms.quantize import quantize
+
+        quantize(self, delta)
+        return self
+
     def optimize(self) -> VectorFst:
         from rustfst.algorithms.optimize import optimize
 
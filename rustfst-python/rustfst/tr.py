@@ -4,6 +4,7 @@ from ctypes import (
     byref,
     c_float,
     c_void_p,
+    cast,
 )
 from rustfst.weight import weight_one
 from rustfst.ffi_utils import (
@@ -24,6 +25,9 @@ class Tr:
         nextstate: The destination state for the arc.
     """
 
+    # A Tr only holds a pointer to its Rust counterpart: no per-instance `__dict__`.
+    __slots__ = ("_ptr",)
+
     def __init__(
         self,
         ilabel: Optional[int] = None,
@@ -41,6 +45,10 @@ class Tr:
             nextstate: The destination state for the transition.
         """
         if ilabel and olabel is None and weight is None and nextstate is None:
+            # Always stored as a `c_void_p`, so that Trs can be put as is in the
+            # pointer arrays passed to the FFI.
+            if not isinstance(ilabel, c_void_p):
+                ilabel = cast(ilabel, c_void_p)
             self._ptr = ilabel
         else:
             if weight is None:
@@ -0,0 +1,22 @@
+from rustfst import VectorFst, Tr
+from rustfst.algorithms.quantize import quantize
+
+
+def test_quantize():
+    fst = VectorFst()
+    s1 = fst.add_state()
+    s2 = fst.add_state()
+    fst.set_start(s1)
+    fst.set_final(s2, 1.26)
+    fst.add_tr(s1, Tr(1, 2, 0.74, s2))
+
+    expected_fst = VectorFst()
+    s1 = expected_fst.add_state()
+    s2 = expected_fst.add_state()
+    expected_fst.set_start(s1)
+    expected_fst.set_final(s2, 1.5)
+    expected_fst.add_tr(s1, Tr(1, 2, 0.5, s2))
+
+    assert quantize(fst, 0.5) == expected_fst
+    assert fst.quantize(0.5) == expected_fst
+
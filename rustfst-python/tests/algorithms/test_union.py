@@ -75,3 +75,28 @@ def test_union():
 
 def test_union_list():
     union_list([VectorFst(), VectorFst(), VectorFst()])
+
+
+def test_union_list_from_shards():
+    shards = []
+    for ilabel in range(1, 4):
+        shard = VectorFst()
+        s1 = shard.add_state()
+        s2 = shard.add_state()
+        shard.set_start(s1)
+        shard.set_final(s2)
+        shard.add_tr(s1, Tr(ilabel, ilabel, 1.0, s2))
+        shards.append(shard)
+
+    shards_copies = [shard.copy() for shard in shards]
+
+    expected_fst = shards[0].copy()
+    for shard in shards[1:]:
+        expected_fst = expected_fst.union(shard)
+
+    assert union_list(shards) == expected_fst
+    assert VectorFst.from_shards(shards) == expected_fst
+    # The shards are not modified by the merge.
+    for shard, shard_copy in zip(shards, shards_copies):
+        assert shard.num_states_ffi() == 2
+        assert shard.equals(shard_copy)
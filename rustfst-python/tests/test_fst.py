@@ -1,6 +1,7 @@
+from array import array
 from pathlib import Path
 
-from rustfst import VectorFst, Tr, SymbolTable
+from rustfst import VectorFst, Tr, SymbolTable, DrawingConfig
 import pytest
 from tempfile import NamedTemporaryFile
 
@@ -34,6 +35,108 @@ def test_small_fst():
     assert fst.num_trs(s1) == 2
 
 
+def test_fst_add_trs():
+    fst = VectorFst()
+
+    # States
+    s1 = fst.add_state()
+    s2 = fst.add_state()
+
+    fst.set_start(s1)
+    fst.set_final(s2)
+
+    trs = [Tr(3, 5, 10.0, s2), Tr(5, 7, 18.0, s2), Tr(1, 1, 2.0, s1)]
+    fst.add_trs(s1, trs)
+    fst.add_trs(s2, [])
+
+    assert fst.num_trs(s1) == 3
+    assert fst.num_trs(s2) == 0
+    for i, tr in enumerate(fst.trs(s1)):
+        assert tr == trs[i]
+
+    # Trs coming from an iterator can be added in batch as well.
+    fst.add_trs(s2, list(fst.trs(s1)))
+    assert fst.num_trs(s2) == 3
+
+
+def test_fst_add_trs_arrays():
+    fst = VectorFst()
+
+    # States
+    s1 = fst.add_state()
+    s2 = fst.add_state()
+
+    fst.set_start(s1)
+    fst.set_final(s2)
+
+    fst.add_trs_arrays(s1, [3, 5], [5, 7], [10.0, 18.0], [s2, s2])
+
+    assert fst.num_trs(s1) == 2
+    trs = [Tr(3, 5, 10.0, s2), Tr(5, 7, 18.0, s2)]
+    for i, tr in enumerate(fst.trs(s1)):
+        assert tr == trs[i]
+
+    with pytest.raises(ValueError):
+        fst.add_trs_arrays(s1, [3, 5], [5], [10.0, 18.0], [s2, s2])
+
+    # Columns exposing the buffer protocol are passed as is.
+    fst.add_trs_arrays(
+        s2,
+        array("Q", [3, 5]),
+        array("Q", [5, 7]),
+        array("f", [10.0, 18.0]),
+        array("Q", [s2, s2]),
+    )
+    assert fst.num_trs(s2) == 2
+    for i, tr in enumerate(fst.trs(s2)):
+        assert tr == Tr(trs[i].ilabel, trs[i].olabel, trs[i].weight, s2)
+
+    # Labels that don't fit in a `Label` are rejected instead of being truncated.
+    with pytest.raises(ValueError):
+        fst.add_trs_arrays(s1, [2 ** 32], [5], [10.0], [s2])
+
+
+def test_fst_add_states():
+    fst = VectorFst()
+
+    s0 = fst.add_state()
+    first = fst.add_states(3)
+
+    assert s0 == 0
+    assert first == 1
+    assert fst.num_states() == 4
+    assert fst.add_state() == 4
+
+    with pytest.raises(ValueError):
+        fst.add_states(-1)
+    with pytest.raises(ValueError):
+        fst.add_states(2 ** 64 - 1)
+    assert fst.num_states() == fst.num_states_ffi() == 5
+
+
+def test_fst_reserve():
+    fst = VectorFst()
+    fst.reserve_states(2)
+
+    s1 = fst.add_state()
+    s2 = fst.add_state()
+
+    fst.reserve_trs(s1, 2)
+    fst.add_trs(s1, [Tr(3, 5, 10.0, s2), Tr(5, 7, 18.0, s2)])
+    assert fst.num_trs(s1) == 2
+
+    with pytest.raises(ValueError):
+        fst.reserve_trs(5, 2)
+    with pytest.raises(ValueError):
+        fst.reserve_trs(s1, -1)
+    with pytest.raises(ValueError):
+        fst.reserve_trs(s1, 2 ** 64 - 1)
+    with pytest.raises(ValueError):
+        fst.reserve_states(-1)
+    with pytest.raises(ValueError):
+        fst.reserve_states(2 ** 64 - 1)
+
+
 def test_final_weight():
     fst = VectorFst()
     s1 = fst.add_state()
@@ -54,6 +157,52 @@ def test_fst_del_states():
     assert fst.num_states() == 0
 
 
+def test_fst_num_states_cache():
+    fst = VectorFst()
+    assert fst.num_states() == 0
+
+    s1 = fst.add_state()
+    s2 = fst.add_state()
+    fst.add_states(2)
+    assert fst.num_states() == fst.num_states_ffi() == 4
+
+    fst.set_start(s1)
+    fst.set_final(s2)
+    fst.add_tr(s1, Tr(1, 1, 1.0, s2))
+
+    other = fst.copy()
+    assert other.num_states() == 4
+
+    fst.connect()
+    assert fst.num_states() == fst.num_states_ffi() == 2
+
+    fst.union(other)
+    assert fst.num_states() == fst.num_states_ffi()
+
+    fst.delete_states()
+    assert fst.num_states() == fst.num_states_ffi() == 0
+
+
+def test_fst_equals():
+    fst = VectorFst()
+    s1 = fst.add_state()
+    s2 = fst.add_state()
+    fst.set_start(s1)
+    fst.set_final(s2)
+    fst.add_tr(s1, Tr(1, 1, 1.0, s2))
+
+    assert fst.equals(fst)
+    assert fst == fst.copy()
+
+    other = fst.copy()
+    other.add_state()
+    assert fst != other
+
+    other = fst.copy()
+    other.add_tr(s2, Tr(2, 2, 1.0, s1))
+    assert fst != other
+
+
 def test_fst_states_iterator():
     fst = VectorFst()
 
@@ -67,6 +216,9 @@ def test_fst_states_iterator():
     for idx, state in enumerate(fst.states()):
         assert state == idx
 
+    assert list(fst.states()) == [s1, s2]
+    assert fst.state_ids() == range(2)
+
 
 def test_fst_trs_iterator():
     fst = VectorFst()
@@ -116,6 +268,26 @@ def test_fst_read_write():
     assert fst == read_fst
 
 
+def test_fst_read_mmap():
+    fst = VectorFst()
+
+    # States
+    s1 = fst.add_state()
+    s2 = fst.add_state()
+
+    fst.set_start(s1)
+    fst.set_final(s2)
+
+    fst.add_tr(s1, Tr(3, 5, 10.0, s2))
+    fst.add_tr(s1, Tr(5, 7, 18.0, s2))
+
+    with NamedTemporaryFile() as f:
+        fst.write(f.name)
+        read_fst = VectorFst.read_mmap(f.name)
+
+    assert fst == read_fst
+
+
 def test_fst_read_write_with_symt():
     fst = VectorFst()
 
@@ -190,6 +362,47 @@ def test_fst_symt():
     assert fst_out_symbols.num_symbols() == 1
 
 
+def test_fst_draw_attaches_symt():
+    fst = VectorFst()
+    s1 = fst.add_state()
+    s2 = fst.add_state()
+    fst.set_start(s1)
+    fst.set_final(s2)
+    fst.add_tr(s1, Tr(1, 2, 1.0, s2))
+
+    input_symt = SymbolTable.from_symbols(["a"])
+    output_symt = SymbolTable.from_symbols(["b", "c"])
+
+    with NamedTemporaryFile() as f:
+        fst.draw(f.name, input_symt, output_symt)
+
+    assert fst.input_symbols() is input_symt
+    assert fst.output_symbols() is output_symt
+    assert fst.input_symbols() is fst.input_symbols()
+
+
+def test_fst_draw_config_update():
+    fst = VectorFst()
+    s1 = fst.add_state()
+    s2 = fst.add_state()
+    fst.set_start(s1)
+    fst.set_final(s2)
+    fst.add_tr(s1, Tr(1, 2, 1.0, s2))
+
+    config = DrawingConfig(fontsize=14)
+    with NamedTemporaryFile() as f:
+        fst.draw(f.name, drawing_config=config)
+        assert "fontsize = 14" in Path(f.name).read_text()
+
+    # The C representation cached by the first draw must not be reused.
+    config.fontsize = 20
+    with NamedTemporaryFile() as f:
+        fst.draw(f.name, drawing_config=config)
+        dot = Path(f.name).read_text()
+    assert "fontsize = 20" in dot
+    assert "fontsize = 14" not in dot
+
+
 def test_fst_with_symt_mut_fail():
     fst = VectorFst()
 
@@ -19,3 +19,11 @@ def test_tr():
     assert a.olabel == 3
     assert pytest.approx(a.weight) == pytest.approx(4.0)
     assert a.next_state == 5
+
+
+def test_tr_slots():
+    a = Tr(1, 1, 1.0, 2)
+
+    assert not hasattr(a, "__dict__")
+    with pytest.raises(AttributeError):
+        setattr(a, "foo", 1)
@@ -1,7 +1,7 @@
-use crate::fst_impls::vector_fst::VectorFst;
+use crate::fst_impls::vector_fst::{VectorFst, VectorFstState};
 use crate::fst_traits::AllocableFst;
 use crate::semirings::Semiring;
-use crate::StateId;
+use crate::{StateId, Tr};
 use anyhow::Result;
 use std::sync::Arc;
 
@@ -75,3 +75,43 @@ impl<W: 'static + Semiring> AllocableFst<W> for VectorFst<W> {
         self.states.get_unchecked(source as usize).trs.0.capacity()
     }
 }
+
+/// Checks that a `Vec<T>` of length `len` can grow by `additional` elements without
+/// overflowing its capacity, which would make `Vec::reserve` panic.
+/// `Vec::try_reserve` is not available on the minimum supported Rust version.
+fn check_capacity<T>(len: usize, additional: usize) -> Result<()> {
+    len.checked_add(additional)
+        .and_then(|capacity| capacity.checked_mul(std::mem::size_of::<T>()))
+        .filter(|&size| size <= isize::MAX as usize)
+        .map(|_| ())
+        .ok_or_else(|| {
+            format_err!(
+                "Capacity overflow: can't reserve {} more elements",
+                additional
+            )
+        })
+}
+
+impl<W: Semiring> VectorFst<W> {
+    /// Same as `reserve_trs` but returns an error instead of panicking if the
+    /// capacity overflows.
+    pub fn try_reserve_trs(&mut self, source: StateId, additional: usize) -> Result<()> {
+        let trs = &mut self
+            .states
+            .get_mut(source as usize)
+            .ok_or_else(|| format_err!("State {:?} doesn't exist", source))?
+            .trs;
+
+        check_capacity::<Tr<W>>(trs.0.len(), additional)?;
+        Arc::make_mut(&mut trs.0).reserve(additional);
+        Ok(())
+    }
+
+    /// Same as `reserve_states` but returns an error instead of panicking if the
+    /// capacity overflows.
+    pub fn try_reserve_states(&mut self, additional: usize) -> Result<()> {
+        check_capacity::<VectorFstState<W>>(self.states.len(), additional)?;
+        self.states.reserve(additional);
+        Ok(())
+    }
+}